@@ -2,12 +2,13 @@ import base64
 import json
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, TypedDict
+from typing import TYPE_CHECKING, List, Optional, Tuple, TypedDict
 
-import httpx
-import jwt
-import typeguard
-import yarl
+if TYPE_CHECKING:
+    import httpx
+
+# httpx, jwt (and cryptography), typeguard and yarl are imported where used,
+# so that `import minioidc` stays cheap for short-lived processes.
 
 
 @dataclass
@@ -44,9 +45,11 @@ class Keys(TypedDict):
 
 
 async def login_url(
-    client: httpx.AsyncClient, provider: Provider, *, state: str, nonce: str = None
+    client: "httpx.AsyncClient", provider: Provider, *, state: str, nonce: str = None
 ) -> str:
     # TODO make nonce optional
+    import yarl
+
     configuration, _ = await metadata(client, provider)
     return str(
         yarl.URL(configuration["authorization_endpoint"]).with_query(
@@ -62,7 +65,7 @@ async def login_url(
 
 
 async def get_tokens(
-    client: httpx.AsyncClient,
+    client: "httpx.AsyncClient",
     provider: Provider,
     *,
     code: str = None,
@@ -98,8 +101,10 @@ async def get_tokens(
 
 # FIXME cache it
 async def metadata(
-    client: httpx.AsyncClient, provider: Provider
+    client: "httpx.AsyncClient", provider: Provider
 ) -> Tuple[Configuration, Keys]:
+    import yarl
+
     r = await client.get(
         str(yarl.URL(provider.issuer) / ".well-known/openid-configuration")
     )
@@ -114,6 +119,8 @@ async def metadata(
 
 
 def _claims(token: Optional[str], keys: Keys, provider: Provider) -> Optional[dict]:
+    import jwt
+
     kids = {k["kid"]: k for k in keys["keys"]}
     if not token:
         return
@@ -153,6 +160,8 @@ def _header(token: str) -> Optional[dict]:
 
 
 def _clean(name, value, type):
+    import typeguard
+
     try:
         value = {k: v for (k, v) in value.items() if k in type.__annotations__}
         typeguard.check_type(name, value, type)
@@ -9,7 +9,6 @@ import secrets
 import time
 from typing import Dict, Optional, Tuple
 
-import httpx
 from fastapi import Depends, FastAPI, Query, Response
 from fastapi.exceptions import HTTPException
 from fastapi.responses import HTMLResponse, RedirectResponse
@@ -17,7 +16,6 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 import minioidc
 
-logging.basicConfig(level=logging.INFO)
 app = FastAPI()
 
 
@@ -109,6 +107,8 @@ async def login(config: Optional[str] = Query(None)):
     except KeyError:
         raise HTTPException(422, "config parameter missing or unknown")
 
+    import httpx
+
     state = secrets.token_hex(20)
     nonce = secrets.token_hex(16)  # FIXME validate nonce
     STATES[state[:8]] = State(time.time(), state, config)
@@ -143,6 +143,8 @@ async def callback(
     if not code:
         raise HTTPException(401, "Ignoring callback without code")
 
+    import httpx
+
     async with httpx.AsyncClient() as client:
         try:
             (
@@ -174,6 +176,8 @@ async def may_refresh(session: Session):
     tokens = [getattr(session, name) for name in ("access_token", "id_token")]
     if not any(t and t["exp"] < time.time() for t in tokens):
         return
+    import httpx
+
     provider = PROVIDERS[session.config]
     async with httpx.AsyncClient() as client:
         try:
@@ -232,7 +236,12 @@ def configure():
     return origin, providers
 
 
-ORIGIN, PROVIDERS = configure()
+@app.on_event("startup")
+def setup():
+    """Read configuration when the app starts, not when the module is imported"""
+    global ORIGIN, PROVIDERS
+    logging.basicConfig(level=logging.INFO)
+    ORIGIN, PROVIDERS = configure()
 
 
 def start():
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative `python -X importtime` budget, in microseconds
+BUDGET = {
+    "minioidc": 100_000,
+    "server": 1_000_000,
+}
+
+HEAVY = ("httpx", "jwt", "cryptography", "typeguard", "yarl")
+
+
+def python(*args, env=None):
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def importtime(module: str) -> int:
+    r = python("-X", "importtime", "-c", f"import {module}")
+    # import time: self [us] | cumulative | imported package
+    for line in r.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        # nested imports are indented, the top-level one is not
+        if name.rstrip() == f" {module}":
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+@pytest.mark.parametrize("module", BUDGET)
+def test_import_time_budget(module):
+    # Best of a few runs to reduce noise from a cold disk cache
+    took = min(importtime(module) for _ in range(3))
+    assert took < BUDGET[module], f"import {module} took {took}us"
+
+
+def test_minioidc_imports_no_heavy_deps():
+    r = python("-c", "import sys, minioidc; print(*sorted(sys.modules))")
+    assert not set(HEAVY) & set(r.stdout.split())
+
+
+def test_server_import_does_not_configure():
+    r = python(
+        "-c",
+        "import server; print(repr(server.ORIGIN), len(server.PROVIDERS))",
+        env={"MINIOIDC_ORIGIN": "http://localhost:3000"},
+    )
+    assert r.stdout.split() == ["''", "0"]